@@ -1,128 +1,521 @@
-"""Utilities for scraping UC Assist service listings with Selenium."""
+"""Utilities for scraping UC Assist service listings.
+
+Listings are read straight from the site's Caspio DataPage where possible, with
+Selenium driving the public search page as a fallback.
+"""
 
 from selenium import webdriver
 from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import TextIO
+from urllib.parse import urldefrag
+import argparse
 import chromedriver_autoinstaller
+import functools
 import json
+import lxml.etree
+import lxml.html
+import multiprocessing.util
+import random
+import re
+import requests
+import time
+
+SEARCH_URL = "https://ucassist.org/search-launch/"
+JSONL_FILENAME = "ucassist_data.jsonl"
+JSON_FILENAME = "ucassist_data.json"
+WAIT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+TABS = 4
+FETCH_THREADS = 8
+BATCH_SIZE = 50
+LABEL_CSS = "div.cbFormLabelCell"
+DATA_CSS = ".cbFormDataCell"
+NEXT_CSS = "[data-cb-name='JumpToNext']"
+# Matched on link text, which CSS selectors can't express.
+VIEW_DETAILS_XPATH = "//a[normalize-space(.)='View Details']"
+SPLIT_KEYS = ("Keyword(s) Associate With Service", "Counties Available")
+# Elements innerText puts on their own lines.
+BLOCK_TAGS = ("div", "p", "li", "tr", "ul", "ol", "table", "h1", "h2", "h3", "h4")
+
+# Reads every label and data cell of a details view in one round trip. Returns
+# null until the labels have rendered so it can double as a wait condition.
+# Label text is skipped (keys: null) when there are as many labels as arguments[2].
+EXTRACT_JS = """
+const labels = [...document.querySelectorAll(arguments[0])];
+if (!labels.length) return null;
+const cells = [...document.querySelectorAll(arguments[1])];
+const keys = labels.map(e => e.innerText);
+const cached = arguments[2];
+const unchanged = cached && cached.length === keys.length
+    && keys.every((key, i) => key === cached[i]);
+return {
+    keys: unchanged ? null : keys,
+    texts: cells.map(e => e.innerText),
+    images: cells.map(e => {
+        const img = e.querySelector('img');
+        return img && img.src;
+    }),
+};
+"""
+
+# Clicks in-page, skipping WebDriver's interception check on overlapped elements.
+JS_CLICK = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Clears the old view so EXTRACT_JS can't read it, then navigates once the
+# script has returned so chromedriver doesn't block on the page load.
+NAVIGATE_JS = """
+const url = arguments[0];
+document.body && document.body.replaceChildren();
+setTimeout(() => window.location.assign(url), 0);
+"""
+
+# Compiled once: per-page cost is then only evaluation, not XPath parsing.
+LABEL_XP = lxml.etree.XPath("//div[contains(@class, 'cbFormLabelCell')]")
+DATA_XP = lxml.etree.XPath("//*[contains(@class, 'cbFormDataCell')]")
+HTML_PARSER = lxml.html.HTMLParser(collect_ids=False)
+CASPIO_EMBED_XP = lxml.etree.XPath("//script[contains(@src, 'caspio.com/dp/')]/@src")
+SEARCH_FORM_XP = lxml.etree.XPath("//form[.//input[@name='searchID']]")
+VIEW_DETAILS_XP = lxml.etree.XPath(VIEW_DETAILS_XPATH)
+NEXT_XP = lxml.etree.XPath("//*[@data-cb-name='JumpToNext']")
+
+# Every details view is the same form, so extract_service_data reads its labels
+# from the browser once and only takes them back when the page's labels differ.
+_KEY_CACHE: list[str] | None = None
+
+# One keep-alive connection pool for every static detail fetch in this process.
+SESSION = requests.Session()
+
+# A pool worker's Browser, kept across its batches so Chrome starts at most once.
+_WORKER_BROWSER: "Browser | None" = None
+
+
+def retry(
+    max_attempts: int = 6,
+    base: float = 0.1,
+    cap: float = 5.0,
+    exceptions: tuple[type[Exception], ...] = (
+        StaleElementReferenceException,
+        ElementClickInterceptedException,
+    ),
+) -> Callable:
+    """Retry the decorated call with capped, jittered exponential backoff."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions:
+                    if attempt == max_attempts - 1:
+                        raise
+                    delay = min(cap, base * 2**attempt)
+                    time.sleep(delay * random.uniform(0.5, 1.5))
+
+        return wrapper
+
+    return decorator
 
 
 def get_driver() -> webdriver:
     """Configure and return a Selenium WebDriver instance."""
     chromedriver_autoinstaller.install()
     options = Options()
+    # Return from navigation at DOMContentLoaded; the implicit wait and the
+    # EXTRACT_JS polling cover anything the page renders after that.
+    options.page_load_strategy = "eager"
     options.add_argument("--start-maximized")
     options.add_argument("--headless=new")
-    return webdriver.Chrome(options=options)
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    # Only text and hrefs are scraped, so skip downloading images. Stylesheets
+    # stay on: innerText depends on them for hidden text and line breaks.
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    driver = webdriver.Chrome(options=options)
+    driver.implicitly_wait(WAIT_TIMEOUT)
+    return driver
 
 
-def get_service_links(driver: webdriver) -> list[WebElement]:
-    """Return all visible 'View Details' links on the current search results page."""
-    service_links = []
-    while not service_links:
-        try:
-            for link in driver.find_elements(By.XPATH, "//a"):
-                if link.get_attribute("innerText") == "View Details":
-                    service_links.append(link)
-        except StaleElementReferenceException:
-            service_links = []
-            continue
-    return service_links
+def set_session(cookies: list[dict], user_agent: str) -> None:
+    """Load a browser's cookies and user agent into the shared requests session."""
+    SESSION.headers["User-Agent"] = user_agent
+    for cookie in cookies:
+        SESSION.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
 
 
-def extract_service_data(driver: webdriver, service_link: WebElement) -> dict:
-    """Click a service link and collect key/value data from the details view."""
-    while True:
-        try:
-            service_link.click()
-            break
-        except ElementClickInterceptedException:
-            driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", service_link
-            )
-            continue
-
-    keys = []
-    while not keys:
-        for key in driver.find_elements(
-            By.XPATH, "//div[contains(@class, 'cbFormLabelCell')]"
-        ):
-            keys.append(key.get_attribute("innerText"))
-
-    values = []
-    while not values:
-        for i, element in enumerate(
-            driver.find_elements(By.XPATH, "//*[contains(@class, 'cbFormDataCell')]")
-        ):
-            img = element.find_elements(By.TAG_NAME, "img")
-            if not img:
-                innerText = element.get_attribute("innerText")
-                if keys[i] in (
-                    "Keyword(s) Associate With Service",
-                    "Counties Available",
-                ):
-                    innerText = innerText.split("\n")
-                values.append(innerText)
-            else:
-                values.append(img[0].get_attribute("src"))
+def followable_url(href: str | None, page_url: str) -> str | None:
+    """Return href minus its fragment if it leads off page_url over HTTP, else None."""
+    if not href:
+        return None
+    url = urldefrag(href).url
+    if not url.startswith(("http://", "https://")) or url == urldefrag(page_url).url:
+        return None
+    return url
 
-    while True:
-        try:
-            back_button = driver.find_element(
-                By.XPATH, "//input[contains(@class, 'cbBackButton')]"
-            )
-            back_button.click()
-            driver.execute_script("document.body.style.zoom='10%'")
-            break
-        except ElementClickInterceptedException:
-            driver.execute_script("document.body.style.zoom='50%'")
-            driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", back_button
-            )
-            continue
 
-    return dict(zip(keys, values))
+def details_urls(hrefs: Iterable[str | None], page_url: str) -> list[str]:
+    """Return the followable 'View Details' URLs, warning about any links dropped."""
+    urls = [followable_url(href=href, page_url=page_url) for href in hrefs]
+    service_urls = [url for url in urls if url is not None]
+    dropped = len(urls) - len(service_urls)
+    if dropped:
+        print(
+            f"\033[33mSkipped {dropped} 'View Details' links without a followable"
+            f" URL on {page_url}.\033[0m"
+        )
+    return service_urls
+
+
+@retry()
+def collect_hrefs(driver: webdriver) -> list[str]:
+    """Return the URLs behind the 'View Details' links on the current results page."""
+    links = driver.find_elements(By.XPATH, VIEW_DETAILS_XPATH)
+    hrefs = [link.get_attribute("href") for link in links]
+    return details_urls(hrefs=hrefs, page_url=driver.current_url)
+
+
+def parse_html(html: bytes, base_url: str) -> lxml.html.HtmlElement:
+    """Parse an HTML document, resolving its links against base_url."""
+    tree = lxml.html.fromstring(html, parser=HTML_PARSER, base_url=base_url)
+    tree.make_links_absolute()
+    return tree
+
 
+def get_caspio_endpoint() -> str | None:
+    """Return the URL of the Caspio DataPage embedded in the search page, if any."""
+    response = SESSION.get(SEARCH_URL, timeout=WAIT_TIMEOUT)
+    response.raise_for_status()
+    sources = CASPIO_EMBED_XP(parse_html(html=response.content, base_url=response.url))
+    if not sources:
+        return None
+    # The embed script lives at <DataPage URL>/emb; the DataPage serves plain HTML.
+    return sources[0].split("?")[0].removesuffix("/emb")
 
-def scrape_page(driver: webdriver, page_number: int) -> list[dict]:
-    """Scrape all services on the current page, returning their detail dictionaries."""
+
+def collect_caspio_hrefs() -> list[str]:
+    """Collect every detail URL from the Caspio DataPage, empty if it's unavailable.
+
+    Failed requests and blank or unparseable pages, which is how anti-bot blocks
+    tend to answer, count as unavailable so the caller can use the browser.
+    """
+    try:
+        return walk_caspio_datapage()
+    except (requests.RequestException, lxml.etree.ParserError):
+        return []
+
+
+def walk_caspio_datapage() -> list[str]:
+    """Submit the search straight to the Caspio DataPage and collect every detail URL.
+
+    Returns an empty list when the DataPage or its search form can't be found, or
+    its Next link can't be followed.
+    """
+    endpoint = get_caspio_endpoint()
+    if endpoint is None:
+        return []
+    response = SESSION.get(endpoint, timeout=WAIT_TIMEOUT)
+    response.raise_for_status()
+    forms = SEARCH_FORM_XP(parse_html(html=response.content, base_url=response.url))
+    if not forms:
+        return []
+
+    form = forms[0]
+    # form_values() leaves out submit buttons, but Caspio reads the one pressed.
+    search_button = form.inputs["searchID"]
+    values = form.form_values() + [(search_button.name, search_button.value or "")]
+    if form.method == "POST":
+        response = SESSION.post(form.action, data=values, timeout=WAIT_TIMEOUT)
+    else:
+        response = SESSION.get(form.action, params=values, timeout=WAIT_TIMEOUT)
+
+    service_urls = []
+    visited = set()
+    requested_url = urldefrag(form.action).url
     while True:
-        try:
-            service_links = get_service_links(driver=driver)
-            data = []
-            for i in range(0, len(service_links)):
-                data.append(
-                    extract_service_data(
-                        driver=driver, service_link=get_service_links(driver=driver)[i]
-                    )
-                )
-                print(f"\033[34mScraped page {page_number}, service {i + 1}.\033[0m")
-            break
-        except StaleElementReferenceException:
-            continue
-        except IndexError:
-            break
+        response.raise_for_status()
+        visited.update({requested_url, urldefrag(response.url).url})
+        tree = parse_html(html=response.content, base_url=response.url)
+        hrefs = [link.get("href") for link in VIEW_DETAILS_XP(tree)]
+        service_urls.extend(details_urls(hrefs=hrefs, page_url=response.url))
+        next_buttons = NEXT_XP(tree)
+        if not next_buttons:
+            return service_urls
+        next_href = next_buttons[0].get("href")
+        next_url = followable_url(href=next_href, page_url=response.url)
+        if next_url is None or next_url in visited:
+            # Paging that can't be followed here would cut the listing short, so
+            # leave it to the browser to click through.
+            return []
+        print(f"\033[34mCollected {len(service_urls)} links from Caspio.\033[0m")
+        requested_url = next_url
+        response = SESSION.get(next_url, timeout=WAIT_TIMEOUT)
+
+
+def fetch_service_data(service_url: str) -> dict:
+    """Collect a service's details from its static HTML, empty if it needs rendering."""
+    try:
+        response = SESSION.get(service_url, timeout=WAIT_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException:
+        # Left to the browser, which may still get through.
+        return {}
+    try:
+        return extract_from_html(html=response.content, base_url=response.url)
+    except lxml.etree.ParserError:
+        # A blank page, likewise left to the browser.
+        return {}
+
+
+def extract_from_html(html: bytes, base_url: str) -> dict:
+    """Collect key/value data from a details view's static HTML."""
+    tree = parse_html(html=html, base_url=base_url)
+    labels = LABEL_XP(tree)
+    if not labels:
+        return {}
+    keys = [inner_text(label) for label in labels]
+    texts, images = [], []
+    for cell in DATA_XP(tree):
+        img = cell.find(".//img")
+        texts.append(inner_text(cell))
+        images.append(img.get("src") if img is not None else None)
+    return build_record(keys=keys, texts=texts, images=images)
+
+
+def inner_text(element: lxml.html.HtmlElement) -> str:
+    """Approximate innerText: collapse whitespace, break at <br> and block elements.
+
+    Script and style contents are left out, as they are in the browser.
+    """
+    for hidden in element.iter("script", "style"):
+        hidden.text = None
+    # Marked with the Unicode line/paragraph separators, which page text won't
+    # contain, so source newlines can be collapsed like any other whitespace.
+    for br in element.iter("br"):
+        br.tail = "\u2028" + (br.tail or "")
+    for block in element.iter(*BLOCK_TAGS):
+        block.text = "\u2029" + (block.text or "")
+        block.tail = "\u2029" + (block.tail or "")
+    text = re.sub(r"[ \t\r\n\f]+", " ", element.text_content())
+    # A <br> ending a block adds no line of its own, so it folds into the break.
+    lines = re.split(r"\u2028? ?\u2029[ \u2029]*|\u2028", text)
+    return "\n".join(line.strip() for line in lines).strip()
+
+
+def open_tabs(driver: webdriver, count: int) -> list[str]:
+    """Open background tabs for rendering details views, returning their handles."""
+    results_window = driver.current_window_handle
+    tabs = []
+    for _ in range(count):
+        driver.switch_to.new_window("tab")
+        tabs.append(driver.current_window_handle)
+    driver.switch_to.window(results_window)
+    return tabs
+
+
+def extract_service_data(
+    driver: webdriver, tabs: list[str], service_urls: list[str]
+) -> list[dict]:
+    """Render each service's details in a worker tab and collect its key/value data."""
+    results_window = driver.current_window_handle
+    data = []
+    try:
+        for start in range(0, len(service_urls), len(tabs)):
+            batch = list(zip(tabs, service_urls[start : start + len(tabs)]))
+            # Start every tab loading before reading any of them. chromedriver
+            # only blocks a command on the current tab's navigation, so the
+            # other tabs keep loading while each one is waited on in turn.
+            for tab, service_url in batch:
+                driver.switch_to.window(tab)
+                driver.execute_script(NAVIGATE_JS, service_url)
+            for tab, service_url in batch:
+                driver.switch_to.window(tab)
+                data.append(read_details_view(driver=driver, service_url=service_url))
+    finally:
+        driver.switch_to.window(results_window)
     return data
 
 
-def click_next_page(driver: webdriver) -> None:
-    """Navigate to the next page of service listings."""
-    while True:
-        try:
-            next_button = driver.find_element(
-                By.XPATH, "//*[@data-cb-name='JumpToNext']"
+def read_details_view(driver: webdriver, service_url: str) -> dict:
+    """Wait for the current tab's details view to render and collect its data.
+
+    Returns an empty dict if it doesn't render in time, so one bad link can't
+    stop the run.
+    """
+    global _KEY_CACHE
+    keys = _KEY_CACHE
+    wait = WebDriverWait(driver, WAIT_TIMEOUT, poll_frequency=POLL_INTERVAL)
+    try:
+        extracted = wait.until(
+            lambda driver: driver.execute_script(
+                EXTRACT_JS, LABEL_CSS, DATA_CSS, keys
             )
-            next_button.click()
-            break
-        except (StaleElementReferenceException, ElementClickInterceptedException):
-            continue
-        except:
-            return True
-    return False
+        )
+    except TimeoutException:
+        print(f"\033[33mTimed out rendering {service_url}, skipping it.\033[0m")
+        return {}
+    if extracted["keys"] is None:
+        extracted["keys"] = keys
+    else:
+        _KEY_CACHE = extracted["keys"]
+    return build_record(**extracted)
+
+
+class Browser:
+    """Renders details views in worker tabs, opened the first time one is needed.
+
+    Without a driver, Chrome itself is only started (and the search run for its
+    session) on first use, and quit when the Browser is closed.
+    """
+
+    def __init__(self, driver: "webdriver | None" = None) -> None:
+        self.driver = driver
+        self.owns_driver = driver is None
+        self.tabs: list[str] = []
+
+    def __enter__(self) -> "Browser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def render(self, service_urls: list[str]) -> list[dict]:
+        """Render each service's details and collect its key/value data."""
+        if self.driver is None:
+            self.driver = get_driver()
+            open_search(driver=self.driver)
+        if not self.tabs:
+            self.tabs = open_tabs(driver=self.driver, count=TABS)
+        return extract_service_data(
+            driver=self.driver, tabs=self.tabs, service_urls=service_urls
+        )
+
+    def close(self) -> None:
+        """Quit Chrome if this Browser started it."""
+        if self.owns_driver and self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+            self.tabs = []
+
+
+def build_record(keys: list[str], texts: list[str], images: list[str | None]) -> dict:
+    """Pair label text with cell values, preferring image URLs over cell text."""
+    record = {}
+    for key, text, src in zip(keys, texts, images):
+        if src:
+            record[key] = src
+        elif key in SPLIT_KEYS:
+            # innerText can leave blank lines between blocks (two after a <p>).
+            record[key] = [line for line in text.split("\n") if line.strip()]
+        else:
+            record[key] = text
+    return record
+
+
+def scrape_services(browser: Browser, service_urls: list[str]) -> list[dict]:
+    """Scrape each service's details, rendering in the browser only where needed."""
+    # Requests release the GIL while waiting on the socket, so threads overlap them.
+    with ThreadPoolExecutor(max_workers=FETCH_THREADS) as executor:
+        data = list(executor.map(fetch_service_data, service_urls))
+    unrendered = [i for i, record in enumerate(data) if not record]
+    if unrendered:
+        rendered = browser.render(service_urls=[service_urls[i] for i in unrendered])
+        for i, record in zip(unrendered, rendered):
+            data[i] = record
+    # Services that never rendered were reported as they were skipped.
+    return [record for record in data if record]
+
+
+@retry()
+def has_next_page(driver: webdriver) -> bool:
+    """Advance to the next page of listings, returning False on the last page."""
+    try:
+        next_button = driver.find_element(By.CSS_SELECTOR, NEXT_CSS)
+    except NoSuchElementException:
+        return False
+    driver.execute_script(JS_CLICK, next_button)
+    WebDriverWait(driver, WAIT_TIMEOUT).until(EC.staleness_of(next_button))
+    return True
+
+
+def open_search(driver: webdriver) -> None:
+    """Load the search page and submit an empty search to list every service."""
+    driver.get(SEARCH_URL)
+    driver.execute_script(JS_CLICK, driver.find_element(By.NAME, "searchID"))
+
+
+def collect_all_hrefs(driver: webdriver) -> list[str]:
+    """Walk every search results page, returning the detail URLs of all services."""
+    service_urls = []
+    page_number = 1
+    complete = False
+    while not complete:
+        page_urls = collect_hrefs(driver=driver)
+        service_urls.extend(page_urls)
+        print(f"\033[34mCollected page {page_number}, {len(page_urls)} links.\033[0m")
+        page_number += 1
+        complete = not has_next_page(driver=driver)
+    return service_urls
+
+
+def iter_service_batches(
+    browser: Browser, service_urls: list[str]
+) -> Iterator[list[dict]]:
+    """Yield the scraped records of service_urls, BATCH_SIZE services at a time."""
+    for start in range(0, len(service_urls), BATCH_SIZE):
+        batch = service_urls[start : start + BATCH_SIZE]
+        yield scrape_services(browser=browser, service_urls=batch)
+        report_batch(start=start, batch=batch, total=len(service_urls))
+
+
+def report_batch(start: int, batch: list[str], total: int) -> None:
+    """Print progress after the batch of services beginning at index start."""
+    print(
+        f"\033[34mScraped services {start + 1}-{start + len(batch)}"
+        f" of {total}.\033[0m"
+    )
+
+
+def init_worker(cookies: list[dict], user_agent: str) -> None:
+    """Give a pool worker the search session and a Browser started on first use."""
+    global _WORKER_BROWSER
+    set_session(cookies=cookies, user_agent=user_agent)
+    _WORKER_BROWSER = Browser()
+    # Pool workers exit without running atexit hooks, but finalizers still run.
+    multiprocessing.util.Finalize(None, _WORKER_BROWSER.close, exitpriority=0)
+
+
+def scrape_worker_batch(service_urls: list[str]) -> list[dict]:
+    """Scrape one batch of services with this pool worker's Browser."""
+    return scrape_services(browser=_WORKER_BROWSER, service_urls=service_urls)
+
+
+def write_records(file: TextIO, data: Iterable[dict]) -> None:
+    """Append cleaned records to an open JSON Lines file and flush them to disk."""
+    for record in clean_data(data):
+        file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    file.flush()
 
 
 def save_data(data: list[dict], filename: str) -> None:
@@ -132,42 +525,112 @@ def save_data(data: list[dict], filename: str) -> None:
     print(f"\033[32mData successfully saved to {filename}!\033[0m")
 
 
-def clean_data(data: list[dict]):
-    """Clean the extracted data."""
-    cleaned_data = []
+def jsonl_to_json(source: str, filename: str) -> None:
+    """Convert a JSON Lines file of records into a single JSON array file."""
+    with open(source) as file:
+        data = [json.loads(line) for line in file if line.strip()]
+    save_data(data=data, filename=filename)
+
+
+def clean_data(data: Iterable[dict]) -> Iterator[dict]:
+    """Clean the extracted data, replacing blank string values with None."""
     for record in data:
-        for key, value in record.items():
-            if value == " ":
-                record[key] = None
-        cleaned_data.append(record)
-    return cleaned_data
+        yield {
+            key: None if isinstance(value, str) and not value.strip() else value
+            for key, value in record.items()
+        }
 
 
-def main() -> None:
-    """Scrape every search-result page and write the combined data set to disk."""
+def scrape_with_browser(file: TextIO, workers: int) -> None:
+    """Walk the search results in the browser, then scrape and write every service."""
     driver = get_driver()
-    driver.get("https://ucassist.org/search-launch/")
+    try:
+        open_search(driver=driver)
+        service_urls = collect_all_hrefs(driver=driver)
+        set_session(
+            cookies=driver.get_cookies(),
+            user_agent=driver.execute_script("return navigator.userAgent"),
+        )
 
-    while True:
-        try:
-            search_button = driver.find_element(By.XPATH, "//input[@name='searchID']")
-            search_button.click()
-            break
-        except NoSuchElementException:
-            continue
+        if workers <= 1:
+            browser = Browser(driver=driver)
+            write_services(file=file, browser=browser, service_urls=service_urls)
+            return
+    finally:
+        driver.quit()
 
-    data = []
-    complete = False
-    page_number = 1
-    while not complete:
-        driver.execute_script("window.scrollTo(0, 0);")
-        page_data = []
-        page_data = scrape_page(driver=driver, page_number=page_number)
-        page_number += 1
-        data.extend(page_data)
-        complete = click_next_page(driver=driver)
+    # The collecting browser is gone; each worker process only starts its own
+    # if one of its services needs rendering.
+    write_in_workers(file=file, service_urls=service_urls, workers=workers)
+
+
+def write_services(file: TextIO, browser: Browser, service_urls: list[str]) -> None:
+    """Scrape every service in this process, writing each batch as it finishes."""
+    for data in iter_service_batches(browser=browser, service_urls=service_urls):
+        write_records(file=file, data=data)
+
+
+def write_in_workers(file: TextIO, service_urls: list[str], workers: int) -> None:
+    """Scrape every service across worker processes sharing SESSION's cookies.
+
+    Pool tasks are BATCH_SIZE slices, and map yields them in order, so the file
+    fills in as each one finishes.
+    """
+    cookies = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+        }
+        for cookie in SESSION.cookies
+    ]
+    user_agent = SESSION.headers["User-Agent"]
+    starts = range(0, len(service_urls), BATCH_SIZE)
+    batches = [service_urls[start : start + BATCH_SIZE] for start in starts]
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(batches))),
+        initializer=init_worker,
+        initargs=(cookies, user_agent),
+    ) as executor:
+        results = executor.map(scrape_worker_batch, batches)
+        for start, batch, data in zip(starts, batches, results):
+            write_records(file=file, data=data)
+            report_batch(start=start, batch=batch, total=len(service_urls))
+
+
+def main() -> None:
+    """Collect every service's detail URL, then scrape each and save the data."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes to split the detail scraping across",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help=f"also write the records as a JSON array to {JSON_FILENAME}",
+    )
+    args = parser.parse_args()
+
+    service_urls = collect_caspio_hrefs()
+    with open(JSONL_FILENAME, "w") as file:
+        if not service_urls:
+            print("\033[33mCaspio DataPage unavailable, using the browser.\033[0m")
+            scrape_with_browser(file=file, workers=args.workers)
+        elif args.workers > 1:
+            write_in_workers(
+                file=file, service_urls=service_urls, workers=args.workers
+            )
+        else:
+            with Browser() as browser:
+                write_services(file=file, browser=browser, service_urls=service_urls)
+    print(f"\033[32mData successfully saved to {JSONL_FILENAME}!\033[0m")
 
-    save_data(data=clean_data(data), filename="ucassist_data.json")
+    if args.json:
+        jsonl_to_json(source=JSONL_FILENAME, filename=JSON_FILENAME)
 
 
 if __name__ == "__main__":
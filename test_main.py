@@ -0,0 +1,182 @@
+"""Offline tests for the HTML parsing and record cleaning helpers."""
+
+from unittest import mock
+import lxml.html
+import requests
+
+from main import SEARCH_URL
+from main import build_record
+from main import clean_data
+from main import collect_caspio_hrefs
+from main import extract_from_html
+from main import fetch_service_data
+from main import inner_text
+import main
+
+DATAPAGE_URL = "https://c0abc123.caspio.com/dp/APPKEY"
+
+
+def test_inner_text_collapses_source_whitespace():
+    element = lxml.html.fragment_fromstring("<div>\n   Food\n   Bank  </div>")
+    assert inner_text(element) == "Food Bank"
+
+
+def test_inner_text_breaks_lines_at_br():
+    element = lxml.html.fragment_fromstring("<span>Alameda<br>\n Contra Costa</span>")
+    assert inner_text(element) == "Alameda\nContra Costa"
+
+
+def test_inner_text_breaks_lines_around_blocks():
+    element = lxml.html.fragment_fromstring(
+        "<div><p>food</p><p>shelter</p><ul><li>a</li><li>b</li></ul></div>"
+    )
+    assert inner_text(element) == "food\nshelter\na\nb"
+
+
+def test_inner_text_folds_a_trailing_br_into_the_block_break():
+    element = lxml.html.fragment_fromstring(
+        "<div><div>Line1<br></div><div>Line2</div></div>"
+    )
+    assert inner_text(element) == "Line1\nLine2"
+
+
+def test_inner_text_skips_script_and_style():
+    element = lxml.html.fragment_fromstring(
+        "<td>Alameda<script>var x=1;</script><style>td {}</style> County</td>"
+    )
+    assert inner_text(element) == "Alameda County"
+
+
+def test_build_record_splits_list_fields_and_prefers_images():
+    record = build_record(
+        keys=["Name", "Counties Available", "Logo"],
+        texts=["Food Bank", "Alameda\n\nContra Costa", ""],
+        images=[None, None, "https://example.org/logo.png"],
+    )
+    assert record == {
+        "Name": "Food Bank",
+        "Counties Available": ["Alameda", "Contra Costa"],
+        "Logo": "https://example.org/logo.png",
+    }
+
+
+def test_extract_from_html_reads_labels_cells_and_images():
+    html = b"""
+    <html><body>
+      <div class="cbFormLabelCell">Name</div>
+      <div class="cbFormDataCell">  Food   Bank </div>
+      <div class="cbFormLabelCell">Keyword(s) Associate With Service</div>
+      <div class="cbFormDataCell"><p>food</p><p>shelter</p></div>
+      <div class="cbFormLabelCell">Logo</div>
+      <div class="cbFormDataCell"><img src="/logo.png"></div>
+    </body></html>
+    """
+    assert extract_from_html(html=html, base_url="https://example.org/details/") == {
+        "Name": "Food Bank",
+        "Keyword(s) Associate With Service": ["food", "shelter"],
+        "Logo": "https://example.org/logo.png",
+    }
+
+
+def test_extract_from_html_reads_labels_from_each_page():
+    page = '<div class="cbFormLabelCell">{}</div><div class="cbFormDataCell">{}</div>'
+    first = page.format("Name", "A").encode()
+    second = page.format("Title", "B").encode()
+    base_url = "https://example.org/"
+    assert extract_from_html(html=first, base_url=base_url) == {"Name": "A"}
+    assert extract_from_html(html=second, base_url=base_url) == {"Title": "B"}
+
+
+def test_extract_from_html_is_empty_without_form_cells():
+    html = b"<html><body><p>Loading...</p></body></html>"
+    assert extract_from_html(html=html, base_url="https://example.org/") == {}
+
+
+def test_clean_data_replaces_blank_strings_with_none():
+    records = [{"a": " ", "b": "\t", "c": "", "d": "x", "e": ["y"], "f": None}]
+    assert list(clean_data(records)) == [
+        {"a": None, "b": None, "c": None, "d": "x", "e": ["y"], "f": None}
+    ]
+
+
+def fake_get(pages: dict[str, bytes]):
+    """Return a stand-in for SESSION.get that serves pages keyed by URL."""
+
+    def get(url, params=None, timeout=None):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = pages[url]
+        response.url = url
+        return response
+
+    return get
+
+
+def caspio_pages(results: bytes, **extra: bytes) -> dict[str, bytes]:
+    """Build a search page embedding a DataPage whose search returns results."""
+    return {
+        SEARCH_URL: f'<script src="{DATAPAGE_URL}/emb"></script>'.encode(),
+        DATAPAGE_URL: (
+            b'<form action="search"><input type="submit" name="searchID" '
+            b'value="Search"></form>'
+        ),
+        "https://c0abc123.caspio.com/dp/search": results,
+        **extra,
+    }
+
+
+def test_collect_caspio_hrefs_follows_next_links():
+    pages = caspio_pages(
+        b'<a href="details?id=1">View Details</a>'
+        b'<a data-cb-name="JumpToNext" href="search?page=2">Next</a>',
+        **{
+            "https://c0abc123.caspio.com/dp/search?page=2": (
+                b'<a href="details?id=2#top">View Details</a>'
+            )
+        },
+    )
+    with mock.patch.object(main.SESSION, "get", side_effect=fake_get(pages)):
+        assert collect_caspio_hrefs() == [
+            "https://c0abc123.caspio.com/dp/details?id=1",
+            "https://c0abc123.caspio.com/dp/details?id=2",
+        ]
+
+
+def test_collect_caspio_hrefs_gives_up_on_unfollowable_paging():
+    pages = caspio_pages(
+        b'<a href="details?id=1">View Details</a>'
+        b'<a data-cb-name="JumpToNext" href="#">Next</a>'
+    )
+    with mock.patch.object(main.SESSION, "get", side_effect=fake_get(pages)):
+        assert collect_caspio_hrefs() == []
+
+
+def test_collect_caspio_hrefs_treats_a_blank_datapage_as_unavailable():
+    pages = {**caspio_pages(b""), DATAPAGE_URL: b""}
+    with mock.patch.object(main.SESSION, "get", side_effect=fake_get(pages)):
+        assert collect_caspio_hrefs() == []
+
+
+def test_collect_caspio_hrefs_treats_a_blank_search_page_as_unavailable():
+    with mock.patch.object(
+        main.SESSION, "get", side_effect=fake_get({SEARCH_URL: b"  "})
+    ):
+        assert collect_caspio_hrefs() == []
+
+
+def test_fetch_service_data_leaves_a_blank_page_to_the_browser():
+    url = "https://example.org/details?id=1"
+    with mock.patch.object(main.SESSION, "get", side_effect=fake_get({url: b""})):
+        assert fetch_service_data(url) == {}
+
+
+def test_collect_caspio_hrefs_warns_about_unfollowable_details_links(capsys):
+    pages = caspio_pages(
+        b'<a href="details?id=1">View Details</a>'
+        b'<a>View Details</a>'
+        b'<a href="javascript:void(0)">View Details</a>'
+    )
+    with mock.patch.object(main.SESSION, "get", side_effect=fake_get(pages)):
+        service_urls = collect_caspio_hrefs()
+    assert service_urls == ["https://c0abc123.caspio.com/dp/details?id=1"]
+    assert "Skipped 2 'View Details' links" in capsys.readouterr().out